@@ -12,60 +12,77 @@
 # Server code adapted from "Python Socket Programming Tutorial" https://www.youtube.com/watch?v=3QiPPX-KeSc
 
 from zxcvbn import zxcvbn
-import socket
-import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import asyncio
+import os
+import struct
 
 # Define the server address and port
 SERVER = '127.0.0.1'
 PORT = 12345
 ADDR = (SERVER, PORT)
 
-# Create the listening socket
-server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+# Bounded pool of worker threads that runs the CPU-bound zxcvbn scoring.  All socket I/O is
+# multiplexed on the event loop, so idle connections cost no thread at all.
+EXECUTOR = ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4)
 
-# Bind the listening socket to the port
-server.bind(ADDR)
 
-
-def start():
-    """Starts the server.  Creates a new thread whenever a client connects."""
-    # Begin listening
-    server.listen()
-    print(f"[LISTENING] Server is listening on {SERVER} Port {PORT}")
-
-    while True:
-        conn, addr = server.accept()
-        thread = threading.Thread(target=handle_client, args=(conn, addr))
-        thread.start()
-        print(f"\n[ACTIVE CONNECTIONS] {threading.active_count() - 1}")
-
-
-def handle_client(conn, addr):
+@lru_cache(maxsize=4096)
+def score_password(pword):
     """
-    Receives the password string, queries zxcvbn, and sends the password strength level and time to crack to the client
-    as two strings.
+    Processes a password with the zxcvbn API and returns the strength score and time to crack.  Results
+    are memoized, so re-testing a password answers from the cache instead of re-running zxcvbn.
     """
-    print(f"[NEW CONNECTION] {addr} connected.")
-
-    # Receive the password to be tested from the client and store it as a string
-    pword = conn.recv(1024).decode()
-
-    # Process the password with the zxcvbn API and receive the results in a dictionary
     zxcvbn_results = zxcvbn(pword)
 
     # zxcvbn uses 4 methods to estimate the time to crack according to https://github.com/dropbox/zxcvbn
     # For now this service will use "offline_fast_hashing_1e10_per_second", but this can easily be changed if needed
+    return zxcvbn_results["score"], zxcvbn_results["crack_times_display"]["offline_fast_hashing_1e10_per_second"]
 
-    strength_score = zxcvbn_results["score"]
-    time_to_crack = zxcvbn_results["crack_times_display"]["offline_fast_hashing_1e10_per_second"]
 
-    # Send the result strings back to the client in 2 send operations
-    conn.send(str(strength_score).encode())
-    conn.send(str(time_to_crack).encode())
+async def handle_client(reader, writer):
+    """
+    Serves one client connection until the client disconnects.  Each request is a 4-byte big-endian
+    length prefix followed by the password; each reply is framed the same way, with the strength level
+    and time to crack separated by 0x1f.  Only the zxcvbn call leaves the event loop, handed to the
+    worker pool so a slow scoring run cannot stall the other connections.
+    """
+    print(f"[NEW CONNECTION] {writer.get_extra_info('peername')} connected.")
+    loop = asyncio.get_running_loop()
+
+    try:
+        while True:
+            # Receive the next framed password, stopping cleanly when the client closes the connection
+            try:
+                header = await reader.readexactly(4)
+                (request_length,) = struct.unpack('>I', header)
+                request = await reader.readexactly(request_length)
+            except asyncio.IncompleteReadError:
+                break
+
+            strength_score, time_to_crack = await loop.run_in_executor(EXECUTOR, score_password, request.decode())
+
+            # Send both result strings back in one framed message.  Two separate sends could be delayed
+            # up to 40ms by Nagle plus delayed-ACK, and could also arrive merged into the client's first
+            # recv.
+            reply = f"{strength_score}\x1f{time_to_crack}".encode()
+            writer.write(struct.pack('>I', len(reply)) + reply)
+            await writer.drain()
+    finally:
+        # Close the connection with the client
+        writer.close()
+        await writer.wait_closed()
+
+
+async def start():
+    """Starts the server and serves clients on the event loop."""
+    server = await asyncio.start_server(handle_client, SERVER, PORT)
+    print(f"[LISTENING] Server is listening on {SERVER} Port {PORT}")
 
-    # Close the connection with the client
-    conn.close()
+    async with server:
+        await server.serve_forever()
 
 
 print("[STARTING] Server is starting...")
-start()
+asyncio.run(start())
@@ -3,34 +3,42 @@
 # Description: Example program that shows how to use the strength tester service.
 
 import socket
+import struct
 
 # Define the address and port used to connect to the strength tester server
 strength_tester_address = '127.0.0.1'
 strength_tester_port = 12345
 
 
+def recv_exact(client_socket, num_bytes):
+    """Reads exactly num_bytes from the connection, or returns None if the server disconnects first."""
+    data = bytearray()
+    while len(data) < num_bytes:
+        chunk = client_socket.recv(num_bytes - len(data))
+        if not chunk:
+            return None
+        data.extend(chunk)
+    return bytes(data)
+
+
 def test_program():
     """
     Test program showing how to use the strength tester microservice.
     """
-    while True:
-        pword = str(input("Please enter the password you would like to test: "))
+    # Connect once and reuse the connection for every password, instead of a TCP handshake per test
+    client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    client_socket.connect((strength_tester_address, strength_tester_port))
 
-        # Create a socket object
-        client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-
-        # Connect to the strength tester server
-        client_socket.connect((strength_tester_address, strength_tester_port))
-
-        # Send the password string
-        client_socket.send((str(pword)).encode())
+    while True:
+        pword = input("Please enter the password you would like to test: ")
 
-        # Receive results strings from the server
-        strength_score = client_socket.recv(1024).decode()
-        time_to_crack = client_socket.recv(1024).decode()
+        # Send the password framed with a 4-byte length prefix
+        payload = pword.encode()
+        client_socket.sendall(struct.pack('>I', len(payload)) + payload)
 
-        # Close the connection
-        client_socket.close()
+        # Receive the framed reply and split it on the delimiter
+        (reply_length,) = struct.unpack('>I', recv_exact(client_socket, 4))
+        strength_score, time_to_crack = recv_exact(client_socket, reply_length).decode().split("\x1f")
 
         print("\nPassword: %s" % (pword))
         print("Strength Level: %s" % strength_score)